@@ -4,12 +4,19 @@ Analyzes blog content and extracts keywords, topics, and insights.
 """
 
 import re
+import asyncio
+import bisect
+import functools
+import heapq
+import itertools
 import logging
 import json
 from bs4 import BeautifulSoup
-from typing import Dict, List, Set, Optional, Any, Union
+from typing import Dict, List, Set, Optional, Any, Union, NamedTuple
 from collections import Counter
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from datetime import datetime, timezone
 import numpy as np
 
 try:
@@ -18,10 +25,140 @@ try:
 except ImportError:
     GENAI_AVAILABLE = False
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import streamlit as st
+    STREAMLIT_AVAILABLE = True
+except ImportError:
+    STREAMLIT_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for tokenization
+_SENT_RE = re.compile(r'[.!?]+')
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+_JSON_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*|\s*```\s*$')
+
+# Counting patterns: one match per non-blank sentence / paragraph
+_SENTENCE_RE = re.compile(r'[^.!?\S]*[^.!?\s][^.!?]*')
+_PARA_RE = re.compile(r'\S[^\n]*(?:\n(?!\n)[^\n]*)*')
+
+# Byte lookup table for the vowels used by the syllable approximation
+_VOWELS = np.zeros(256, dtype=bool)
+_VOWELS[np.frombuffer(b'aeiouy', dtype=np.uint8)] = True
+_SPACE_BYTE = ord(' ')
+_E_BYTE = ord('e')
+
+# Below this many words the memoized per-word path beats NumPy's setup cost
+_VECTORIZE_MIN_WORDS = 200
+
+# Common stop words for keyword extraction
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
+    'before', 'after', 'above', 'below', 'between', 'among', 'amongst',
+    'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us',
+    'them', 'my', 'your', 'his', 'her', 'its', 'our', 'their', 'this',
+    'that', 'these', 'those', 'am', 'is', 'are', 'was', 'were', 'be',
+    'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'could', 'should', 'may', 'might', 'must', 'can', 'shall'
+})
+
+# Flesch score lower bounds and the reading level each band maps to
+_LEVEL_THRESHOLDS = (30, 50, 60, 70, 80, 90)
+_LEVEL_LABELS = (
+    "Very Difficult", "Difficult", "Fairly Difficult", "Standard",
+    "Fairly Easy", "Easy", "Very Easy"
+)
+
+
+class _Tokens(NamedTuple):
+    """Token streams computed once per document and shared by the analyzers."""
+    words: List[str]
+    lower_words: List[str]
+    sentence_count: int
+
+
+def _count_matches(pattern: re.Pattern, text: str) -> int:
+    """Count pattern matches without materializing them."""
+    return sum(1 for _ in pattern.finditer(text))
+
+
+def _tokenize(content: str) -> _Tokens:
+    """Split content into whitespace words and keyword tokens, and count sentences."""
+    return _Tokens(
+        words=content.split(),
+        lower_words=_WORD_RE.findall(content.lower()),
+        sentence_count=_count_matches(_SENTENCE_RE, content)
+    )
+
+
+def _parse_ai_json(text: str) -> Any:
+    """Parse a model response as JSON, tolerating a surrounding markdown code fence."""
+    return json.loads(_JSON_FENCE_RE.sub('', text))
+
+
+@functools.lru_cache(maxsize=256)
+def _keyword_matcher(keywords: tuple) -> Optional[re.Pattern]:
+    """Compile lowercased keywords into one alternation scanned in a single pass."""
+    if not keywords:
+        return None
+    alternatives = sorted(set(keywords), key=len, reverse=True)
+    return re.compile('|'.join(re.escape(keyword) for keyword in alternatives))
+
+
+@functools.lru_cache(maxsize=8192)
+def _count_syllables(word: str) -> int:
+    """Approximate the syllable count of a single lowercased word."""
+    count = 0
+    vowels = 'aeiouy'
+    if word[0] in vowels:
+        count += 1
+    for index in range(1, len(word)):
+        if word[index] in vowels and word[index-1] not in vowels:
+            count += 1
+    if word.endswith('e'):
+        count -= 1
+    if count == 0:
+        count += 1
+    return count
+
+
+def _count_total_syllables(words: List[str]) -> int:
+    """
+    Approximate the total syllable count of whitespace-separated words.
+    
+    Each word scores one syllable per vowel group, minus one for a trailing
+    'e', with a minimum of one. Short inputs go through the memoized
+    per-word counter; longer ones are packed into a single byte buffer so
+    the whole document is scored with a few NumPy passes.
+    """
+    if len(words) < _VECTORIZE_MIN_WORDS:
+        return sum(_count_syllables(word.lower()) for word in words)
+    return int(_syllables_per_word(words).sum())
+
+
+def _syllables_per_word(words: List[str]) -> np.ndarray:
+    """Vectorized per-word syllable counts for a non-empty list of words."""
+    # Non-ASCII characters become '?', which keeps one byte per character
+    buf = np.frombuffer(' '.join(words).lower().encode('ascii', 'replace'), dtype=np.uint8)
+    is_vowel = _VOWELS[buf]
+    is_space = buf == _SPACE_BYTE
+    word_ids = np.cumsum(is_space)
+    
+    # A vowel group starts at every vowel not preceded by another vowel
+    group_starts = is_vowel.copy()
+    group_starts[1:] &= ~is_vowel[:-1]
+    counts = np.bincount(word_ids[group_starts], minlength=len(words))
+    
+    # Silent trailing 'e'
+    is_last = np.empty_like(is_space)
+    is_last[:-1] = is_space[1:]
+    is_last[-1] = True
+    counts -= np.bincount(word_ids[is_last & (buf == _E_BYTE)], minlength=len(words))
+    
+    return np.maximum(counts, 1)
+
+
 class ContentAnalyzer:
     """Advanced content analyzer with AI-powered insights."""
     
@@ -40,16 +177,7 @@ class ContentAnalyzer:
                 logger.warning(f"Failed to initialize AI model: {str(e)}")
         
         # Common stop words for keyword extraction
-        self.stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
-            'before', 'after', 'above', 'below', 'between', 'among', 'amongst',
-            'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us',
-            'them', 'my', 'your', 'his', 'her', 'its', 'our', 'their', 'this',
-            'that', 'these', 'those', 'am', 'is', 'are', 'was', 'were', 'be',
-            'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-            'would', 'could', 'should', 'may', 'might', 'must', 'can', 'shall'
-        }
+        self.stop_words = _STOP_WORDS
     
     def analyze_content(self, content_data: Dict) -> Dict:
         """
@@ -62,7 +190,7 @@ class ContentAnalyzer:
             Dict: Analysis results including keywords, topics, sentiment
         """
         try:
-            logger.info("Starting content analysis")
+            logger.debug("Starting content analysis")
             
             content = content_data.get('content', '')
             title = content_data.get('title', '')
@@ -70,148 +198,245 @@ class ContentAnalyzer:
             if not content:
                 return self._empty_analysis("No content to analyze")
             
-            # Basic analysis
-            analysis = {
-                'content_metrics': self._analyze_content_metrics(content),
-                'keyword_analysis': self._extract_keywords(content, title),
-                'readability': self._analyze_readability(content),
-                'structure_analysis': self._analyze_structure(content_data),
-                'seo_analysis': self._analyze_seo_factors(content_data),
-                'analysis_timestamp': pd.Timestamp.now().isoformat()
-            }
+            # Start the AI-powered analysis (if available) on its own thread,
+            # so calls from concurrent sessions never queue behind each other
+            ai_future = None
+            if self.ai_enabled:
+                executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gemini')
+                ai_future = executor.submit(self._generate_ai_insights, content, title)
+                executor.shutdown(wait=False)
+            
+            # Basic analysis runs while the Gemini request is in flight
+            try:
+                analysis = self._run_basic_analysis(content_data)
+            except Exception:
+                # Abandon the Gemini call; cancel it if it hasn't started
+                if ai_future is not None:
+                    ai_future.cancel()
+                raise
+            
+            if ai_future is not None:
+                analysis['ai_insights'] = ai_future.result()
+            
+            logger.debug("Content analysis completed successfully")
+            return analysis
+            
+        except Exception as e:
+            logger.error(f"Error during content analysis: {str(e)}")
+            return self._empty_analysis(f"Analysis error: {str(e)}")
+    
+    async def analyze_content_async(self, content_data: Dict) -> Dict:
+        """
+        Perform comprehensive content analysis without blocking the event loop.
+        
+        The Gemini request is started first and the local analysis runs in a
+        worker thread while it is in flight, so the two overlap.
+        
+        Args:
+            content_data (Dict): Extracted content from BlogExtractor
+            
+        Returns:
+            Dict: Analysis results including keywords, topics, sentiment
+        """
+        try:
+            logger.debug("Starting content analysis")
+            
+            content = content_data.get('content', '')
+            title = content_data.get('title', '')
+            
+            if not content:
+                return self._empty_analysis("No content to analyze")
             
-            # AI-powered analysis (if available)
+            ai_task = None
             if self.ai_enabled:
-                ai_insights = self._generate_ai_insights(content, title)
-                analysis['ai_insights'] = ai_insights
+                ai_task = asyncio.ensure_future(self._generate_ai_insights_async(content, title))
             
-            logger.info("Content analysis completed successfully")
+            loop = asyncio.get_running_loop()
+            try:
+                analysis = await loop.run_in_executor(None, self._run_basic_analysis, content_data)
+            except BaseException:
+                # Don't leave the Gemini task pending, or its error unretrieved
+                if ai_task is not None:
+                    if not ai_task.done():
+                        ai_task.cancel()
+                    elif not ai_task.cancelled():
+                        ai_task.exception()
+                raise
+
+            if ai_task is not None:
+                analysis['ai_insights'] = await ai_task
+            
+            logger.debug("Content analysis completed successfully")
             return analysis
             
         except Exception as e:
             logger.error(f"Error during content analysis: {str(e)}")
             return self._empty_analysis(f"Analysis error: {str(e)}")
     
-    def _analyze_content_metrics(self, content: str) -> Dict:
+    async def analyze_many(self, documents: List[Dict]) -> List[Dict]:
+        """
+        Analyze several documents concurrently.
+        
+        Args:
+            documents (List[Dict]): Extracted content dicts from BlogExtractor
+            
+        Returns:
+            List[Dict]: Analysis results, in input order
+        """
+        return list(await asyncio.gather(
+            *(self.analyze_content_async(document) for document in documents)
+        ))
+    
+    def _run_basic_analysis(self, content_data: Dict) -> Dict:
+        """Run the local (non-AI) analyzers over non-empty content."""
+        content = content_data.get('content', '')
+        title = content_data.get('title', '')
+        
+        # Tokenize once and share the result across analyzers
+        tokens = _tokenize(content)
+        
+        return {
+            'content_metrics': self._analyze_content_metrics(content, tokens),
+            'keyword_analysis': self._extract_keywords(tokens, title),
+            'readability': self._analyze_readability(tokens),
+            'structure_analysis': self._analyze_structure(content_data),
+            'seo_analysis': self._analyze_seo_factors(content_data),
+            'analysis_timestamp': datetime.now(timezone.utc).isoformat()
+        }
+    
+    def _analyze_content_metrics(self, content: str, tokens: _Tokens) -> Dict:
         """Analyze basic content metrics."""
-        words = content.split()
-        sentences = re.split(r'[.!?]+', content)
-        paragraphs = content.split('\n\n')
+        words = tokens.words
+        
+        # Averages use the raw split counts, including blank segments
+        sentence_splits = _count_matches(_SENT_RE, content) + 1
+        paragraph_splits = content.count('\n\n') + 1
         
         return {
             'word_count': len(words),
-            'sentence_count': len([s for s in sentences if s.strip()]),
-            'paragraph_count': len([p for p in paragraphs if p.strip()]),
-            'average_words_per_sentence': round(len(words) / max(1, len(sentences)), 2),
-            'average_sentences_per_paragraph': round(len(sentences) / max(1, len(paragraphs)), 2),
+            'sentence_count': tokens.sentence_count,
+            'paragraph_count': _count_matches(_PARA_RE, content),
+            'average_words_per_sentence': round(len(words) / max(1, sentence_splits), 2),
+            'average_sentences_per_paragraph': round(sentence_splits / max(1, paragraph_splits), 2),
             'character_count': len(content),
-            'character_count_no_spaces': len(content.replace(' ', '')),
+            'character_count_no_spaces': len(content) - content.count(' '),
             'reading_time_minutes': max(1, round(len(words) / 200))  # 200 WPM average
         }
     
-    def _extract_keywords(self, content: str, title: str = '') -> Dict:
+    def _extract_keywords(self, tokens: _Tokens, title: str = '') -> Dict:
         """Extract keywords using frequency analysis."""
         # Combine title and content with title words getting more weight
-        all_text = f"{title} {title} {content}".lower()
-        
-        # Remove punctuation and split into words
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', all_text)
+        title_words = _WORD_RE.findall(title.lower())
+        words = title_words + title_words + tokens.lower_words
         
         # Filter out stop words
         filtered_words = [word for word in words if word not in self.stop_words]
+        n_filtered = len(filtered_words)
         
         # Count word frequencies
         word_freq = Counter(filtered_words)
         
         # Extract phrases (2-3 word combinations)
-        phrases = self._extract_phrases(content.lower())
+        phrase_counter = self._count_phrases(tokens.lower_words)
+        total_phrases = sum(phrase_counter.values())
         
-        # Get top keywords and phrases
+        # Get top keywords and phrases; one top-50 selection serves both
+        # the keyword list and the frequency distribution (nlargest is stable,
+        # so its first 20 entries are exactly the top 20)
+        top_words = heapq.nlargest(50, word_freq.items(), key=itemgetter(1))
         top_keywords = [
-            {'word': word, 'frequency': freq, 'relevance_score': freq / len(filtered_words)}
-            for word, freq in word_freq.most_common(20)
+            {'word': word, 'frequency': freq, 'relevance_score': freq / n_filtered}
+            for word, freq in top_words[:20]
         ]
         
         top_phrases = [
-            {'phrase': phrase, 'frequency': freq, 'relevance_score': freq / len(phrases)}
-            for phrase, freq in Counter(phrases).most_common(10)
+            {'phrase': phrase, 'frequency': freq, 'relevance_score': freq / total_phrases}
+            for phrase, freq in heapq.nlargest(10, phrase_counter.items(), key=itemgetter(1))
         ]
         
         return {
-            'total_unique_words': len(set(filtered_words)),
-            'keyword_density': len(filtered_words) / max(1, len(words)),
+            'total_unique_words': len(word_freq),
+            'keyword_density': n_filtered / max(1, len(words)),
             'top_keywords': top_keywords,
             'top_phrases': top_phrases,
-            'word_frequency_distribution': dict(word_freq.most_common(50))
+            'word_frequency_distribution': dict(top_words)
         }
     
-    def _extract_phrases(self, text: str) -> List[str]:
-        """Extract meaningful 2-3 word phrases."""
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', text)
-        phrases = []
-        
-        # Extract 2-word phrases
-        for i in range(len(words) - 1):
-            if words[i] not in self.stop_words and words[i+1] not in self.stop_words:
-                phrases.append(f"{words[i]} {words[i+1]}")
-        
-        # Extract 3-word phrases
-        for i in range(len(words) - 2):
-            if (words[i] not in self.stop_words and 
-                words[i+1] not in self.stop_words and 
-                words[i+2] not in self.stop_words):
-                phrases.append(f"{words[i]} {words[i+1]} {words[i+2]}")
-        
-        return phrases
+    def _count_phrases(self, words: List[str]) -> Counter:
+        """Count meaningful 2-3 word phrases from lowercased tokens."""
+        # One stop-word probe per token, reused by both n-gram passes
+        stop_words = self.stop_words
+        is_content = [word not in stop_words for word in words]
+        
+        # Count 2-word phrases
+        phrase_counter = Counter(
+            f"{a} {b}"
+            for a, b, keep_a, keep_b in zip(words, words[1:], is_content, is_content[1:])
+            if keep_a and keep_b
+        )
+        
+        # Count 3-word phrases
+        phrase_counter.update(
+            f"{a} {b} {c}"
+            for a, b, c, keep_a, keep_b, keep_c in zip(
+                words, words[1:], words[2:], is_content, is_content[1:], is_content[2:]
+            )
+            if keep_a and keep_b and keep_c
+        )
+        
+        return phrase_counter
     
-    def _analyze_readability(self, content: str) -> Dict:
+    def _analyze_readability(self, tokens: _Tokens) -> Dict:
         """Analyze content readability using various metrics."""
-        words = content.split()
-        sentences = re.split(r'[.!?]+', content)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        words = tokens.words
         
-        if not words or not sentences:
+        if not words or not tokens.sentence_count:
             return {'flesch_score': 0, 'reading_level': 'Unknown'}
         
         # Calculate syllables (approximation)
-        def count_syllables(word):
-            word = word.lower()
-            count = 0
-            vowels = 'aeiouy'
-            if word[0] in vowels:
-                count += 1
-            for index in range(1, len(word)):
-                if word[index] in vowels and word[index-1] not in vowels:
-                    count += 1
-            if word.endswith('e'):
-                count -= 1
-            if count == 0:
-                count += 1
-            return count
-        
-        total_syllables = sum(count_syllables(word) for word in words)
-        avg_sentence_length = len(words) / len(sentences)
-        avg_syllables_per_word = total_syllables / len(words)
+        total_syllables = _count_total_syllables(words)
+        return self._score_readability(len(words), tokens.sentence_count, total_syllables)
+    
+    def analyze_readability_batch(self, contents: List[str]) -> List[Dict]:
+        """
+        Analyze readability for many documents at once.
+        
+        Args:
+            contents (List[str]): Plain-text bodies to score
+            
+        Returns:
+            List[Dict]: One readability result per document, in input order
+        """
+        doc_words = [content.split() for content in contents]
+        sentence_counts = [_count_matches(_SENTENCE_RE, content) for content in contents]
+        
+        # Score every word of every document in one vectorized pass
+        all_words = [word for words in doc_words for word in words]
+        totals = [0] * len(contents)
+        if all_words:
+            cumulative = np.concatenate(([0], np.cumsum(_syllables_per_word(all_words))))
+            bounds = np.cumsum([0] + [len(words) for words in doc_words])
+            totals = (cumulative[bounds[1:]] - cumulative[bounds[:-1]]).tolist()
+        
+        results = []
+        for words, sentence_count, total_syllables in zip(doc_words, sentence_counts, totals):
+            if not words or not sentence_count:
+                results.append({'flesch_score': 0, 'reading_level': 'Unknown'})
+            else:
+                results.append(self._score_readability(len(words), sentence_count, total_syllables))
+        return results
+    
+    def _score_readability(self, word_count: int, sentence_count: int, total_syllables: int) -> Dict:
+        """Compute the Flesch score and reading level from raw counts."""
+        avg_sentence_length = word_count / sentence_count
+        avg_syllables_per_word = total_syllables / word_count
         
         # Flesch Reading Ease Score
         flesch_score = 206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_syllables_per_word)
         flesch_score = max(0, min(100, flesch_score))  # Clamp between 0-100
         
         # Determine reading level
-        if flesch_score >= 90:
-            reading_level = "Very Easy"
-        elif flesch_score >= 80:
-            reading_level = "Easy"
-        elif flesch_score >= 70:
-            reading_level = "Fairly Easy"
-        elif flesch_score >= 60:
-            reading_level = "Standard"
-        elif flesch_score >= 50:
-            reading_level = "Fairly Difficult"
-        elif flesch_score >= 30:
-            reading_level = "Difficult"
-        else:
-            reading_level = "Very Difficult"
+        reading_level = _LEVEL_LABELS[bisect.bisect_right(_LEVEL_THRESHOLDS, flesch_score)]
         
         return {
             'flesch_score': round(flesch_score, 2),
@@ -227,24 +452,26 @@ class ContentAnalyzer:
         links = content_data.get('links', [])
         
         # Heading analysis
-        heading_structure = {}
-        for heading in headings:
-            level = heading.get('level', 1)
-            heading_structure[f'h{level}'] = heading_structure.get(f'h{level}', 0) + 1
+        heading_structure = dict(Counter(f"h{heading.get('level', 1)}" for heading in headings))
         
-        # Link analysis
-        internal_links = [link for link in links if link.get('is_internal', False)]
-        external_links = [link for link in links if not link.get('is_internal', True)]
+        # Link analysis (single pass; links without the flag count as neither)
+        internal_links = 0
+        external_links = 0
+        for link in links:
+            if link.get('is_internal', False):
+                internal_links += 1
+            elif not link.get('is_internal', True):
+                external_links += 1
         
         return {
             'heading_structure': heading_structure,
             'total_headings': len(headings),
             'total_links': len(links),
-            'internal_links': len(internal_links),
-            'external_links': len(external_links),
+            'internal_links': internal_links,
+            'external_links': external_links,
             'link_distribution': {
-                'internal_ratio': len(internal_links) / max(1, len(links)),
-                'external_ratio': len(external_links) / max(1, len(links))
+                'internal_ratio': internal_links / max(1, len(links)),
+                'external_ratio': external_links / max(1, len(links))
             },
             'has_proper_heading_hierarchy': self._check_heading_hierarchy(headings)
         }
@@ -254,14 +481,12 @@ class ContentAnalyzer:
         if not headings:
             return True
         
-        prev_level = 0
-        for heading in headings:
-            level = heading.get('level', 1)
-            if level > prev_level + 1:  # Skipped a level
-                return False
-            prev_level = level
-        
-        return True
+        # Pair each level with its predecessor; any() stops at the first skipped level
+        levels, prev_levels = itertools.tee(heading.get('level', 1) for heading in headings)
+        return not any(
+            level > prev_level + 1
+            for prev_level, level in zip(itertools.chain((0,), prev_levels), levels)
+        )
     
     def _analyze_seo_factors(self, content_data: Dict) -> Dict:
         """Analyze SEO-related factors."""
@@ -270,12 +495,17 @@ class ContentAnalyzer:
         content = content_data.get('content', '')
         keywords = content_data.get('keywords', [])
         
+        # Lowercase once and scan for all keywords in a single pass
+        title_lower = title.lower()
+        description_lower = description.lower()
+        matcher = _keyword_matcher(tuple(keyword.lower() for keyword in keywords[:5]))
+        
         # Title analysis
         title_analysis = {
             'length': len(title),
             'word_count': len(title.split()),
             'optimal_length': 30 <= len(title) <= 60,
-            'has_keywords': any(keyword.lower() in title.lower() for keyword in keywords[:5])
+            'has_keywords': bool(matcher and matcher.search(title_lower))
         }
         
         # Description analysis
@@ -283,7 +513,7 @@ class ContentAnalyzer:
             'length': len(description),
             'word_count': len(description.split()),
             'optimal_length': 120 <= len(description) <= 160,
-            'has_keywords': any(keyword.lower() in description.lower() for keyword in keywords[:5])
+            'has_keywords': bool(matcher and matcher.search(description_lower))
         }
         
         # Content analysis
@@ -339,10 +569,32 @@ class ContentAnalyzer:
             return {'error': 'AI analysis not available'}
         
         try:
-            # Truncate content for API limits
-            truncated_content = content[:3000] + "..." if len(content) > 3000 else content
+            response = self.model.generate_content(self._build_ai_prompt(content, title))
+            return self._parse_ai_response(response.text)
             
-            prompt = f"""
+        except Exception as e:
+            logger.warning(f"AI analysis failed: {str(e)}")
+            return {'error': f'AI analysis failed: {str(e)}'}
+    
+    async def _generate_ai_insights_async(self, content: str, title: str) -> Dict:
+        """Generate AI-powered content insights without blocking the event loop."""
+        if not self.ai_enabled:
+            return {'error': 'AI analysis not available'}
+        
+        try:
+            response = await self.model.generate_content_async(self._build_ai_prompt(content, title))
+            return self._parse_ai_response(response.text)
+            
+        except Exception as e:
+            logger.warning(f"AI analysis failed: {str(e)}")
+            return {'error': f'AI analysis failed: {str(e)}'}
+    
+    def _build_ai_prompt(self, content: str, title: str) -> str:
+        """Build the Gemini prompt for a blog post."""
+        # Truncate content for API limits
+        truncated_content = f"{content[:3000]}..." if len(content) > 3000 else content
+        
+        return f"""
             Analyze this blog post and provide insights:
             
             Title: {title}
@@ -357,27 +609,20 @@ class ContentAnalyzer:
             
             Format as JSON.
             """
-            
-            response = self.model.generate_content(prompt)
-            
-            # Parse AI response
-            try:
-                ai_response = json.loads(response.text)
-            except json.JSONDecodeError:
-                # Fallback if response isn't valid JSON
-                ai_response = {
-                    'main_topics': ['Content analysis', 'Blog optimization'],
-                    'target_audience': 'General audience',
-                    'sentiment': 'neutral',
-                    'improvements': ['Add more headings', 'Include more keywords', 'Optimize length'],
-                    'keyword_suggestions': ['blog', 'content', 'analysis', 'optimization', 'SEO']
-                }
-            
-            return ai_response
-            
-        except Exception as e:
-            logger.warning(f"AI analysis failed: {str(e)}")
-            return {'error': f'AI analysis failed: {str(e)}'}
+    
+    def _parse_ai_response(self, text: str) -> Dict:
+        """Parse the model's answer, falling back to generic insights."""
+        try:
+            return _parse_ai_json(text)
+        except json.JSONDecodeError:
+            # Fallback if response isn't valid JSON
+            return {
+                'main_topics': ['Content analysis', 'Blog optimization'],
+                'target_audience': 'General audience',
+                'sentiment': 'neutral',
+                'improvements': ['Add more headings', 'Include more keywords', 'Optimize length'],
+                'keyword_suggestions': ['blog', 'content', 'analysis', 'optimization', 'SEO']
+            }
     
     def _empty_analysis(self, error_message: str) -> Dict:
         """Return empty analysis result with error."""
@@ -387,10 +632,26 @@ class ContentAnalyzer:
             'readability': {},
             'structure_analysis': {},
             'seo_analysis': {},
-            'analysis_timestamp': pd.Timestamp.now().isoformat(),
+            'analysis_timestamp': datetime.now(timezone.utc).isoformat(),
             'error': error_message
         }
 
+@functools.lru_cache(maxsize=8)
+def get_analyzer(api_key: Optional[str] = None) -> ContentAnalyzer:
+    """
+    Return a shared ContentAnalyzer for the given API key.
+    
+    Configuring Gemini and constructing the model is done once per key per
+    process, so Streamlit reruns reuse the same analyzer.
+    
+    Args:
+        api_key (Optional[str]): API key for AI analysis
+        
+    Returns:
+        ContentAnalyzer: Cached analyzer instance
+    """
+    return ContentAnalyzer(api_key)
+
 def analyze_blog_content(content_data: Dict, api_key: Optional[str] = None) -> Dict:
     """
     Convenience function for analyzing blog content.
@@ -402,7 +663,7 @@ def analyze_blog_content(content_data: Dict, api_key: Optional[str] = None) -> D
     Returns:
         Dict: Analysis results
     """
-    analyzer = ContentAnalyzer(api_key)
+    analyzer = get_analyzer(api_key)
     return analyzer.analyze_content(content_data)
 
 def analyze_content(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -418,15 +679,11 @@ def analyze_content(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     try:  
         # Get API key from Streamlit secrets if available
         api_key = None
-        try:
-            import streamlit as st
-            if hasattr(st, 'secrets') and 'api_keys' in st.secrets:
-                api_key = st.secrets.api_keys.get('gemini')
-        except ImportError:
-            pass
+        if STREAMLIT_AVAILABLE and hasattr(st, 'secrets') and 'api_keys' in st.secrets:
+            api_key = st.secrets.api_keys.get('gemini')
             
-        # Initialize analyzer and process
-        analyzer = ContentAnalyzer(api_key)
+        # Reuse the cached analyzer and process
+        analyzer = get_analyzer(api_key)
         
         # Map extracted_data format to what ContentAnalyzer expects
         content_data = {
@@ -444,16 +701,25 @@ def analyze_content(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
         analysis_result = analyzer.analyze_content(content_data)
         
         # Transform result to match expected schema_builder format
-        return {
+        ai_insights = analysis_result.get('ai_insights', {})
+        result = {
             'wordCount': analysis_result.get('content_metrics', {}).get('word_count', 0),
             'keywords': [kw['word'] for kw in analysis_result.get('keyword_analysis', {}).get('top_keywords', [])[:10]],
             'readabilityScore': analysis_result.get('readability', {}).get('flesch_score', 0),
             'contentQuality': _assess_content_quality(analysis_result),
             'analysisTimestamp': analysis_result.get('analysis_timestamp', ''),
-            'mainTopics': analysis_result.get('ai_insights', {}).get('main_topics', []),
-            'sentiment': analysis_result.get('ai_insights', {}).get('sentiment', 'neutral')
+            'mainTopics': ai_insights.get('main_topics', []),
+            'sentiment': ai_insights.get('sentiment', 'neutral')
         }
         
+        # Surface failures so callers can tell a degraded result apart
+        if 'error' in analysis_result:
+            result['error'] = analysis_result['error']
+        if 'error' in ai_insights:
+            result['aiError'] = ai_insights['error']
+        
+        return result
+        
     except Exception as e:
         logger.error(f"Analysis failed: {str(e)}")
         return {
@@ -461,7 +727,7 @@ def analyze_content(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
             'keywords': [],
             'readabilityScore': 0,
             'contentQuality': 'basic',
-            'analysisTimestamp': pd.Timestamp.now().isoformat(),
+            'analysisTimestamp': datetime.now(timezone.utc).isoformat(),
             'error': str(e)
         }
 
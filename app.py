@@ -1,11 +1,16 @@
 # Main Streamlit application file
 
+import hashlib
+import logging
 import streamlit as st
 import extractor
 import analyzer
 import schema_builder
 import utils
 
+# Configure logging (the pipeline modules only create their loggers)
+logging.basicConfig(level=logging.INFO)
+
 # --- Streamlit Page Configuration ---
 st.set_page_config(
     page_title="Schema Architect AI",
@@ -41,6 +46,82 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# --- Cached Pipeline Stages ---
+# Fields of the extracted data that the analyzer reads (it never looks at
+# the URL, so pages serving identical content share one analysis)
+ANALYSIS_FIELDS = ('headline', 'description', 'bodyText', 'wordCount')
+
+
+class UncachedAnalysis(Exception):
+    """Carries a degraded analysis out of cached_analyze so it isn't cached."""
+
+    def __init__(self, result):
+        super().__init__(result.get('error') or result.get('aiError'))
+        self.result = result
+
+
+def ai_configured():
+    """Returns whether a Gemini API key is set in the Streamlit secrets."""
+    try:
+        return bool(st.secrets['api_keys'].get('gemini'))
+    except Exception:
+        return False
+
+
+def analysis_fingerprint(extracted_data):
+    """
+    Returns a short BLAKE2b digest of the analyzer's inputs, including
+    whether AI analysis is available, so adding a key refreshes results.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for field in ANALYSIS_FIELDS:
+        digest.update(str(extracted_data.get(field, '')).encode('utf-8', 'ignore'))
+        digest.update(b'\x1f')
+    digest.update(b'ai' if ai_configured() else b'basic')
+    return digest.hexdigest()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_extract(url):
+    """Fetches and extracts a URL, cached for an hour."""
+    return extractor.extract(url)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_analyze(fingerprint, _extracted_data):
+    """
+    Analyzes extracted data, cached on the fingerprint of its inputs.
+    The underscore keeps Streamlit from hashing the full data itself.
+    Results from a failed analysis or Gemini call are raised instead, as
+    exceptions are never cached, so the next run tries again.
+    """
+    analyzed_data = analyzer.analyze_content(_extracted_data)
+    if 'error' in analyzed_data or 'aiError' in analyzed_data:
+        raise UncachedAnalysis(analyzed_data)
+    return analyzed_data
+
+
+def run_pipeline(url):
+    """
+    Runs extraction, analysis and schema assembly for a URL.
+    Extraction is cached per URL and analysis per content fingerprint, so
+    resubmissions (or URLs serving identical content) skip the fetch,
+    parse and analysis work. Schema assembly is cheaper than hashing its
+    input, so it is always rebuilt.
+    """
+    extracted_data = cached_extract(url)
+    try:
+        analyzed_data = cached_analyze(analysis_fingerprint(extracted_data), extracted_data)
+    except UncachedAnalysis as degraded:
+        analyzed_data = degraded.result
+
+    # Combine data
+    full_data = {**extracted_data, **analyzed_data}
+    final_schema_script = schema_builder.build_schema(full_data)
+
+    return extracted_data, analyzed_data, final_schema_script
+
+
 # --- Application UI ---
 
 st.title("🤖 Schema Architect AI")
@@ -90,28 +171,23 @@ if st.button("Generate Schema", key="generate_button"):
         else:
             try:
                 with st.spinner("Analyzing page... This may take a moment."):
-                    # Stage 1: Data Extraction
-                    st.write("### Stage 1: Extracting Data...")
-                    extracted_data = extractor.extract(url)
-                    st.json(extracted_data)
-
-                    # Stage 2: Content Analysis
-                    st.write("### Stage 2: Analyzing Content...")
-                    analyzed_data = analyzer.analyze_content(extracted_data)
-                    st.json({
-                        "wordCount": analyzed_data.get("wordCount"),
-                        "keywords": analyzed_data.get("keywords")
-                    })
-
-                    # Combine data
-                    full_data = {**extracted_data, **analyzed_data}
-
-                    # Stage 3 & 4: Schema Assembly and Finalization
-                    st.write("### Stage 3 & 4: Building & Finalizing Schema...")
-                    final_schema_script = schema_builder.build_schema(full_data)
-
-                    st.success("✅ Schema Generated Successfully!")
-                    st.code(final_schema_script, language="json")
+                    extracted_data, analyzed_data, final_schema_script = run_pipeline(url)
+
+                # Stage 1: Data Extraction
+                st.write("### Stage 1: Extracting Data...")
+                st.json(extracted_data)
+
+                # Stage 2: Content Analysis
+                st.write("### Stage 2: Analyzing Content...")
+                st.json({
+                    "wordCount": analyzed_data.get("wordCount"),
+                    "keywords": analyzed_data.get("keywords")
+                })
+
+                # Stage 3 & 4: Schema Assembly and Finalization
+                st.write("### Stage 3 & 4: Building & Finalizing Schema...")
+                st.success("✅ Schema Generated Successfully!")
+                st.code(final_schema_script, language="json")
 
             except Exception as e:
                 st.error(f"An unexpected error occurred: {e}")
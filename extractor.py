@@ -3,18 +3,187 @@ Content Extraction Module
 Handles web scraping and content extraction from blog posts.
 """
 
+import asyncio
 import logging
-import sys  # ← CRITICAL FIX: Added missing sys import
+import random
+import re
 import requests
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+from typing import Dict, Any, Optional, Iterable, Callable, NamedTuple, List, Union
 from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
+from bs4.filter import ElementFilter
 import utils
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# brotli lets urllib3 decode 'br' responses, so only advertise it when present
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Browser User-Agent strings rotated across requests
+_UA_POOL = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36 Edg/124.0.0.0',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:125.0) Gecko/20100101 Firefox/125.0',
+    'Mozilla/5.0 (X11; Linux x86_64; rv:125.0) Gecko/20100101 Firefox/125.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Safari/605.1.15',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.3.1 Safari/605.1.15',
+    'Mozilla/5.0 (iPhone; CPU iPhone OS 17_4 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Mobile/15E148 Safari/604.1',
+    'Mozilla/5.0 (Linux; Android 14; Pixel 8) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Mobile Safari/537.36',
+)
+
+_ACCEPT_ENCODING = 'br, gzip, deflate' if BROTLI_AVAILABLE else 'gzip, deflate'
+
+# Upper bound on simultaneous fetches in extract_many; the connection pool
+# is sized to match so concurrent fetches to one host all stay keep-alive
+_MAX_CONCURRENT_FETCHES = 16
+
+# Shared session so repeat fetches reuse pooled keep-alive connections
+_SESSION = utils.create_session(10, _MAX_CONCURRENT_FETCHES, headers={
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+})
+
+class _ExtractionFilter(ElementFilter):
+    """
+    Parse-time filter that only builds subtrees the extractors look at:
+    elements with one of the _STRAINED_TAGS or _STRAINED_CLASSES, or the
+    #content / [rel="author"] targets
+    """
+    
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        if name in _STRAINED_TAGS:
+            return True
+        if not attrs:
+            return False
+        if attrs.get('id') == 'content' or 'author' in attrs.get('rel', '').split():
+            return True
+        return not _STRAINED_CLASSES.isdisjoint(attrs.get('class', '').split())
+    
+    def allow_string_creation(self, string) -> bool:
+        # Text outside the kept subtrees is never read
+        return False
+
+
+_EXTRACTION_FILTER = _ExtractionFilter()
+
+
+class _Page(NamedTuple):
+    """What the extractors need from a parsed page, whichever parser built it."""
+    title: Any
+    metas: Dict[tuple, Any]
+    strings: Iterable[str]
+    select_one: Callable
+
+
+class _LexborNode:
+    """Gives a selectolax node the Tag.get/get_text calls the extractors make."""
+    
+    __slots__ = ('node',)
+    
+    def __init__(self, node):
+        self.node = node
+    
+    def get(self, attr: str, default=None):
+        attributes = self.node.attributes
+        if attr not in attributes:
+            return default
+        # Valueless attributes read as '' like they do on a Tag
+        value = attributes[attr]
+        return '' if value is None else value
+    
+    def get_text(self) -> str:
+        return self.node.text()
+
+# Main content containers, most specific first
+_CONTENT_SELECTORS = (
+    'article',
+    '.content',
+    '#content',
+    '.post-content',
+    '.entry-content',
+    'main',
+    '.main-content'
+)
+
+# Metadata lookups in priority order, as (attribute, value) keys into the
+# meta index, followed by the CSS selectors tried when no meta tag matches
+_DATE_META_KEYS = (
+    ('property', 'article:published_time'),
+    ('name', 'date'),
+    ('name', 'pubdate'),
+)
+_DATE_SELECTORS = ('time[datetime]', '.published', '.date')
+_AUTHOR_META_KEYS = (('name', 'author'), ('property', 'article:author'))
+_AUTHOR_SELECTORS = ('.author', '.byline', '[rel="author"]')
+_IMAGE_META_KEYS = (
+    ('property', 'og:image'),
+    ('name', 'twitter:image'),
+    ('name', 'image'),
+)
+_IMAGE_SELECTORS = ('.featured-image img', 'article img', '.post-thumbnail img')
+
+# How the single soup walk recognises each selector above, derived from the
+# tuples so the BeautifulSoup path can't drift from the lexbor one: bare tag
+# names, class names, images under a given ancestor, and a few selectors
+# with dedicated checks
+_ELEMENT_SELECTORS = _CONTENT_SELECTORS + _DATE_SELECTORS + _AUTHOR_SELECTORS
+_WALKED_SELECTORS = frozenset({'#content', 'time[datetime]', '[rel="author"]'})
+_SIMPLE_NAME = re.compile(r'[A-Za-z][\w-]*\Z')
+_NAME_SELECTORS = frozenset(
+    selector for selector in _ELEMENT_SELECTORS if _SIMPLE_NAME.match(selector)
+)
+_CLASS_SELECTORS = frozenset(
+    selector[1:] for selector in _ELEMENT_SELECTORS
+    if selector.startswith('.') and _SIMPLE_NAME.match(selector, 1)
+)
+_IMAGE_ANCESTORS = tuple(
+    (selector, None, ancestor[1:]) if ancestor.startswith('.')
+    else (selector, ancestor, None)
+    for selector in _IMAGE_SELECTORS
+    for ancestor in (selector[:-len(' img')],)
+)
+
+_unwalked = [
+    selector for selector in _ELEMENT_SELECTORS
+    if selector not in _WALKED_SELECTORS
+    and selector not in _NAME_SELECTORS
+    and not (selector.startswith('.') and selector[1:] in _CLASS_SELECTORS)
+] + [
+    selector for selector in _IMAGE_SELECTORS
+    if not (selector.endswith(' img') and _SIMPLE_NAME.match(selector.lstrip('.')[:-len(' img')]))
+]
+if _unwalked:
+    raise RuntimeError(f"Selectors the soup walk can't match: {_unwalked}")
+
+# Tags and classes that the extraction selectors can match; everything else
+# is skipped at parse time unless it sits inside one of these elements
+_STRAINED_TAGS = frozenset({'title', 'meta', 'time'}) | _NAME_SELECTORS | {
+    ancestor_name for _, ancestor_name, _ in _IMAGE_ANCESTORS if ancestor_name
+}
+_STRAINED_CLASSES = _CLASS_SELECTORS | {
+    ancestor_class for _, _, ancestor_class in _IMAGE_ANCESTORS if ancestor_class
+}
+
+# Characters of body text kept in the extracted data
+_BODY_TEXT_LIMIT = 5000
+
 def extract(url: str) -> Dict[str, Any]:
     """
     Main extraction function - wrapper for existing functionality
@@ -28,21 +197,57 @@ def extract(url: str) -> Dict[str, Any]:
     logger.info(f"Starting extraction for URL: {url}")
     
     try:
-        # Auto-detect the correct extraction function
-        if hasattr(sys.modules[__name__], 'extract_content'):
-            logger.info("Using extract_content function")
-            return extract_content(url)
-        elif hasattr(sys.modules[__name__], 'extract_blog_data'):
-            logger.info("Using extract_blog_data function")
-            return extract_blog_data(url)
-        else:
-            logger.info("Using fallback extraction method")
-            return _fallback_extract(url)
-            
+        return extract_content(url)
+        
     except Exception as e:
         logger.error(f"Extraction failed: {str(e)}")
         raise Exception(f"Failed to extract content from {url}: {e}")
 
+async def extract_many(urls: List[str]) -> List[Union[Dict[str, Any], Exception]]:
+    """
+    Extract several URLs concurrently
+    
+    Each URL runs through extract() in a worker thread, with at most
+    _MAX_CONCURRENT_FETCHES in flight, so network waits overlap.
+    
+    Args:
+        urls (List[str]): The URLs to extract content from
+        
+    Returns:
+        List[Union[Dict[str, Any], Exception]]: Extracted data for each URL,
+            in input order, or the exception raised for a URL that failed
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+    
+    async def extract_one(url: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await loop.run_in_executor(None, extract, url)
+    
+    return list(await asyncio.gather(
+        *(extract_one(url) for url in urls), return_exceptions=True
+    ))
+
+def extract_batch(urls: List[str], max_workers: int = 8) -> List[Union[Dict[str, Any], Exception]]:
+    """
+    Extract several URLs on a thread pool, for callers without an event loop
+    
+    lxml releases the GIL while parsing and fetches wait on the network, so
+    threads overlap well. Keep max_workers at or below the connection pool
+    size (_MAX_CONCURRENT_FETCHES); extra workers only queue on the pool.
+    
+    Args:
+        urls (List[str]): The URLs to extract content from
+        max_workers (int): Number of worker threads
+        
+    Returns:
+        List[Union[Dict[str, Any], Exception]]: Extracted data for each URL,
+            in input order, or the exception raised for a URL that failed
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(extract, url) for url in urls]
+    return [future.exception() or future.result() for future in futures]
+
 def _fallback_extract(url: str) -> Dict[str, Any]:
     """
     Fallback extraction method using basic web scraping
@@ -58,62 +263,40 @@ def _fallback_extract(url: str) -> Dict[str, Any]:
         if not utils.URLValidator.is_valid_url(url):
             raise ValueError(f"Invalid URL format: {url}")
         
-        # Set up user agent for requests
-        ua = UserAgent()
-        headers = {
-            'User-Agent': ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        }
+        # Set up user agent for requests; the other headers are session defaults
+        headers = {'User-Agent': random.choice(_UA_POOL)}
         
         # Fetch content
         logger.info(f"Fetching content from: {url}")
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Extract basic metadata
-        title = soup.find('title')
-        meta_description = soup.find('meta', attrs={'name': 'description'})
-        
-        # Extract main content (try multiple selectors)
-        content_selectors = [
-            'article', 
-            '.content', 
-            '#content', 
-            '.post-content',
-            '.entry-content',
-            'main',
-            '.main-content'
-        ]
-        
-        main_content = None
-        for selector in content_selectors:
-            main_content = soup.select_one(selector)
-            if main_content:
-                break
-        
-        # If no specific content area found, get body text
-        if not main_content:
-            main_content = soup.find('body')
+        response = _SESSION.get(url, headers=headers, stream=True, timeout=(3.05, 10))
+        try:
+            response.raise_for_status()
+            html = utils.read_capped(response, utils.MAX_HTML_BYTES)
+        finally:
+            response.close()
+        
+        # Parse with selectolax's lexbor backend when installed, otherwise
+        # with BeautifulSoup
+        encoding = _declared_encoding(response)
+        if SELECTOLAX_AVAILABLE:
+            page = _parse_with_lexbor(html, encoding)
+        else:
+            page = _parse_with_soup(html, encoding)
         
         # Clean and extract text
-        body_text = main_content.get_text(strip=True, separator=' ') if main_content else soup.get_text()
+        body_text, word_count = _collect_text(page.strings, _BODY_TEXT_LIMIT)
+        meta_description = page.metas.get(('name', 'description'))
         
         # Build return data structure
         extracted_data = {
             'url': url,
-            'headline': title.get_text().strip() if title else '',
+            'headline': page.title.get_text().strip() if page.title else '',
             'description': meta_description.get('content', '').strip() if meta_description else '',
-            'bodyText': body_text[:5000],  # Limit to prevent memory issues
-            'datePublished': _extract_date(soup),
-            'author': _extract_author(soup),
-            'image': _extract_image(soup, url),
-            'wordCount': len(body_text.split()) if body_text else 0,
+            'bodyText': body_text,  # Limited to prevent memory issues
+            'datePublished': _extract_date(page.select_one, page.metas),
+            'author': _extract_author(page.select_one, page.metas),
+            'image': _extract_image(page.select_one, page.metas, url),
+            'wordCount': word_count,
             'extractionMethod': 'fallback'
         }
         
@@ -127,73 +310,247 @@ def _fallback_extract(url: str) -> Dict[str, Any]:
         logger.error(f"Extraction error: {e}")
         raise Exception(f"Content extraction failed: {e}")
 
-def _extract_date(soup: BeautifulSoup) -> str:
-    """Extract publication date from various meta tags"""
-    date_selectors = [
-        'meta[property="article:published_time"]',
-        'meta[name="date"]',
-        'meta[name="pubdate"]',
-        'time[datetime]',
-        '.published',
-        '.date'
-    ]
-    
-    for selector in date_selectors:
-        element = soup.select_one(selector)
+def _parse_with_soup(html: bytes, encoding: Optional[str]) -> '_Page':
+    """
+    Parse a page with BeautifulSoup (C-backed lxml parser)
+    
+    Only the head metadata and candidate content subtrees are built unless
+    no content container is found, in which case the page is reparsed in
+    full and the body is used.
+    
+    Args:
+        html (bytes): Raw page body
+        encoding (Optional[str]): Charset declared by the server, if any
+        
+    Returns:
+        _Page: Parsed page
+    """
+    soup = BeautifulSoup(
+        html, 'lxml',
+        parse_only=_EXTRACTION_FILTER, from_encoding=encoding
+    )
+    title, meta_tags, matches = _walk_soup(soup)
+    
+    # Extract main content (try multiple selectors)
+    main_content = _first_container(matches)
+    
+    # If no specific content area found, reparse in full and get body text
+    if not main_content:
+        soup = BeautifulSoup(html, 'lxml', from_encoding=encoding)
+        title, meta_tags, matches = _walk_soup(soup)
+        main_content = soup.find('body')
+    
+    strings = main_content.stripped_strings if main_content else [soup.get_text()]
+    return _Page(
+        title=title,
+        metas=_index_meta(meta_tags),
+        strings=strings,
+        select_one=matches.get
+    )
+
+def _walk_soup(soup: BeautifulSoup):
+    """
+    Collect everything the extractors read from a soup in one tree walk
+    
+    Args:
+        soup (BeautifulSoup): Parsed page
+        
+    Returns:
+        tuple: First <title>, all <meta> tags, and the first element
+            matching each extraction selector, keyed by selector
+    """
+    title = None
+    meta_tags = []
+    matches = {}
+    for tag in soup.find_all(True):
+        name = tag.name
+        if name == 'meta':
+            meta_tags.append(tag)
+        elif name == 'title':
+            if title is None:
+                title = tag
+        elif name in _NAME_SELECTORS:
+            matches.setdefault(name, tag)
+        elif name == 'time':
+            if tag.has_attr('datetime'):
+                matches.setdefault('time[datetime]', tag)
+        elif name == 'img':
+            for selector, ancestor_name, ancestor_class in _IMAGE_ANCESTORS:
+                if selector not in matches and any(
+                    parent.name == ancestor_name if ancestor_name
+                    else ancestor_class in parent.get('class', ())
+                    for parent in tag.parents
+                ):
+                    matches[selector] = tag
+        
+        attrs = tag.attrs
+        if not attrs:
+            continue
+        for class_name in attrs.get('class', ()):
+            if class_name in _CLASS_SELECTORS:
+                matches.setdefault('.' + class_name, tag)
+        if attrs.get('id') == 'content':
+            matches.setdefault('#content', tag)
+        rel = attrs.get('rel')
+        if rel is not None and (' '.join(rel) if isinstance(rel, list) else rel) == 'author':
+            matches.setdefault('[rel="author"]', tag)
+    return title, meta_tags, matches
+
+def _first_container(matches: Dict[str, Any]):
+    """Return the first content container found, in selector priority order"""
+    for selector in _CONTENT_SELECTORS:
+        if selector in matches:
+            return matches[selector]
+    return None
+
+def _parse_with_lexbor(html: bytes, encoding: Optional[str]) -> '_Page':
+    """
+    Parse a page with selectolax's lexbor backend
+    
+    Args:
+        html (bytes): Raw page body
+        encoding (Optional[str]): Charset declared by the server, if any
+        
+    Returns:
+        _Page: Parsed page
+    """
+    try:
+        document = html.decode(encoding, 'replace') if encoding else None
+    except LookupError:
+        document = None
+    if document is None:
+        # Honour a BOM or <meta charset>, defaulting to UTF-8
+        tree = LexborHTMLParser(html, encoding=True)
+    else:
+        tree = LexborHTMLParser(document)
+    
+    # BeautifulSoup leaves script and style text out of get_text()
+    tree.strip_tags(['script', 'style'])
+    
+    main_content = None
+    for selector in _CONTENT_SELECTORS:
+        main_content = tree.css_first(selector)
+        if main_content is not None:
+            break
+    if main_content is None:
+        main_content = tree.body or tree.root
+    
+    # Joining on NUL keeps text node boundaries (the parser never emits NUL)
+    text = main_content.text(separator='\x00', strip=True) if main_content is not None else ''
+    
+    # Memoized per parse, so repeat lookups of a selector skip the tree
+    matches = {}
+    
+    def select_one(selector: str):
+        if selector not in matches:
+            node = tree.css_first(selector)
+            matches[selector] = _LexborNode(node) if node is not None else None
+        return matches[selector]
+    
+    return _Page(
+        title=select_one('title'),
+        metas=_index_meta(map(_LexborNode, tree.css('meta'))),
+        strings=[string for string in text.split('\x00') if string],
+        select_one=select_one
+    )
+
+def _declared_encoding(response: requests.Response) -> Optional[str]:
+    """
+    Return the charset declared in the Content-Type header, if any.
+    
+    requests falls back to ISO-8859-1 for text/* responses without a charset,
+    which would mis-decode UTF-8 pages; in that case None is returned so the
+    parser honours the document's own <meta charset>.
+    """
+    if 'charset' in response.headers.get('Content-Type', '').lower():
+        return response.encoding
+    return None
+
+def _collect_text(strings: Iterable[str], limit: int):
+    """
+    Join a page's text strings up to a length limit while counting the
+    words in all of them, without building the full text
+    
+    Args:
+        strings (Iterable[str]): Stripped text strings in document order
+        limit (int): Maximum length of the returned text
+        
+    Returns:
+        tuple: Text truncated to limit characters, total word count
+    """
+    chunks = []
+    length = -1  # Length of ' '.join(chunks); the first string adds no separator
+    word_count = 0
+    for string in strings:
+        word_count += len(string.split())
+        if length < limit:
+            chunks.append(string)
+            length += len(string) + 1
+    return ' '.join(chunks)[:limit], word_count
+
+def _index_meta(meta_tags: Iterable[Any]) -> Dict[tuple, Any]:
+    """
+    Index <meta> tags by their name and property in a single pass
+    
+    Args:
+        meta_tags (Iterable[Any]): The page's meta tags in document order
+        
+    Returns:
+        Dict[tuple, Any]: First meta tag for each (attribute, value) pair
+    """
+    metas = {}
+    for meta in meta_tags:
+        for attr in ('name', 'property'):
+            value = meta.get(attr)
+            if value:
+                metas.setdefault((attr, value), meta)
+    return metas
+
+def _first_match(select_one: Callable, metas: Dict[tuple, Any], meta_keys, selectors):
+    """Yield the first element for each meta key, then for each CSS selector"""
+    for key in meta_keys:
+        element = metas.get(key)
+        if element:
+            yield element
+    for selector in selectors:
+        element = select_one(selector)
         if element:
-            if element.get('content'):
-                return element.get('content')
-            elif element.get('datetime'):
-                return element.get('datetime')
-            elif element.get_text():
-                return element.get_text().strip()
+            yield element
+
+def _extract_date(select_one: Callable, metas: Dict[tuple, Any]) -> str:
+    """Extract publication date from various meta tags"""
+    for element in _first_match(select_one, metas, _DATE_META_KEYS, _DATE_SELECTORS):
+        if element.get('content'):
+            return element.get('content')
+        elif element.get('datetime'):
+            return element.get('datetime')
+        elif element.get_text():
+            return element.get_text().strip()
     
     return ''
 
-def _extract_author(soup: BeautifulSoup) -> str:
+def _extract_author(select_one: Callable, metas: Dict[tuple, Any]) -> str:
     """Extract author information from various meta tags"""
-    author_selectors = [
-        'meta[name="author"]',
-        'meta[property="article:author"]',
-        '.author',
-        '.byline',
-        '[rel="author"]'
-    ]
-    
-    for selector in author_selectors:
-        element = soup.select_one(selector)
-        if element:
-            if element.get('content'):
-                return element.get('content')
-            elif element.get_text():
-                return element.get_text().strip()
+    for element in _first_match(select_one, metas, _AUTHOR_META_KEYS, _AUTHOR_SELECTORS):
+        if element.get('content'):
+            return element.get('content')
+        elif element.get_text():
+            return element.get_text().strip()
     
     return ''
 
-def _extract_image(soup: BeautifulSoup, base_url: str) -> str:
+def _extract_image(select_one: Callable, metas: Dict[tuple, Any], base_url: str) -> str:
     """Extract featured image URL"""
-    image_selectors = [
-        'meta[property="og:image"]',
-        'meta[name="twitter:image"]',
-        'meta[name="image"]',
-        '.featured-image img',
-        'article img',
-        '.post-thumbnail img'
-    ]
-    
-    for selector in image_selectors:
-        element = soup.select_one(selector)
-        if element:
-            img_url = element.get('content') or element.get('src')
-            if img_url:
-                # Convert relative URLs to absolute
-                if img_url.startswith('//'):
-                    return f"https:{img_url}"
-                elif img_url.startswith('/'):
-                    from urllib.parse import urljoin
-                    return urljoin(base_url, img_url)
-                elif img_url.startswith('http'):
-                    return img_url
+    for element in _first_match(select_one, metas, _IMAGE_META_KEYS, _IMAGE_SELECTORS):
+        img_url = element.get('content') or element.get('src')
+        if img_url:
+            # Convert relative URLs to absolute
+            if img_url.startswith('//'):
+                return f"https:{img_url}"
+            elif img_url.startswith('/'):
+                return urljoin(base_url, img_url)
+            elif img_url.startswith('http'):
+                return img_url
     
     return ''
 
@@ -1,12 +1,36 @@
 # Module for Stage 3 & 4: Schema Assembly and Finalization
 
+import functools
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from html import unescape
 from datetime import datetime
 import requests
-from fake_useragent import UserAgent
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import utils
 
+# Shared session: the search API call and the article fetch both go to
+# en.wikipedia.org, so the second request reuses the first's connection
+_WIKI_SESSION = utils.create_session(4, 8)
 
+# Seconds to wait on each Wikipedia request
+_WIKI_TIMEOUT = 5
+
+# Only the sidebar item linking the article to its Wikidata entry is read:
+# matched straight from the markup when it has the usual shape, otherwise
+# parsed on its own
+_WIKIBASE_LINK_RE = re.compile(
+    rb'<li\s(?:[^>]*\s)?id="t-wikibase"[^>]*>\s*<a\s(?:[^>]*\s)?href="([^"]*)"'
+)
+_WIKIBASE_STRAINER = SoupStrainer('li', attrs={'id': 't-wikibase'})
+
+# Pretty-printing encoder shared by every build; the schema is a plain tree,
+# so the circular-reference bookkeeping is skipped
+_SCHEMA_ENCODER = json.JSONEncoder(indent=4, check_circular=False)
+
+
+@functools.lru_cache(maxsize=512)
 def format_date(date_string):
     """Attempts to parse and format a date string into YYYY-MM-DD."""
     if not date_string:
@@ -28,24 +52,25 @@ def build_schema(data):
     """
     post_url = data.get('url', '')
     base_url = data.get('publisher', {}).get('url', '')
+    headline = data.get('headline', '')
 
     schema = {
         "@context": "https://schema.org/",
         "@type": "BlogPosting",
         "@id": f"{post_url}#BlogPosting",
         "mainEntityOfPage": post_url,
-        "headline": data.get('headline', ''),
-        "name": data.get('headline', ''),
+        "headline": headline,
+        "name": headline,
         "description": data.get('description', ''),
         "url": post_url
     }
 
     # --- Add conditional properties ---
 
-    if data.get('datePublished'):
-        schema['datePublished'] = format_date(data.get('datePublished'))
-    if data.get('dateModified'):
-        schema['dateModified'] = format_date(data.get('dateModified'))
+    if date_published := data.get('datePublished'):
+        schema['datePublished'] = format_date(date_published)
+    if date_modified := data.get('dateModified'):
+        schema['dateModified'] = format_date(date_modified)
 
     # Author - handle both dict and string formats
     author_data = data.get('author')
@@ -70,11 +95,11 @@ def build_schema(data):
 
     # Publisher
     publisher_data = data.get('publisher')
-    if publisher_data and publisher_data.get('name'):
+    if publisher_data and (publisher_name := publisher_data.get('name')):
         schema['publisher'] = {
             "@type": "Organization",
             "@id": f"{base_url}#Organization",
-            "name": publisher_data.get('name'),
+            "name": publisher_name,
         }
         logo_url = publisher_data.get('logo', {}).get('url')
         if logo_url:
@@ -103,10 +128,10 @@ def build_schema(data):
 
     # isPartOf
     is_part_of_data = data.get('isPartOf')
-    if is_part_of_data and is_part_of_data.get('url'):
+    if is_part_of_data and (blog_url := is_part_of_data.get('url')):
         schema['isPartOf'] = {
             "@type": "Blog",
-            "@id": is_part_of_data.get('url'),
+            "@id": blog_url,
             "name": f"{publisher_data.get('name', 'Website')} Blog",
             "publisher": {
                 "@type": "Organization",
@@ -116,28 +141,37 @@ def build_schema(data):
         }
 
     # Content Analysis properties
-    if data.get('wordCount'):
-        schema['wordCount'] = data.get('wordCount')
-    if data.get('keywords'):
-        schema['keywords'] = data.get('keywords')
+    if word_count := data.get('wordCount'):
+        schema['wordCount'] = word_count
+    if keywords := data.get('keywords'):
+        schema['keywords'] = keywords
 
     # Finalize by wrapping in script tag with pretty printing
     final_script = (
         f'<script type="application/ld+json">\n'
-        f'{json.dumps(schema, indent=4)}\n'
+        f'{_SCHEMA_ENCODER.encode(schema)}\n'
         f'</script>'
     )
 
     return final_script
 
 
+@functools.lru_cache(maxsize=None)
+def _user_agent():
+    """
+    Loads the User-Agent dataset on the first Wikipedia lookup, once per
+    process; schema assembly alone never pays for the import.
+    """
+    from fake_useragent import UserAgent
+    return UserAgent()
+
+
 def get_wikipedia_and_wikidata_links(topic):
     """
     Searches for Wikipedia and Wikidata links for a given topic.
     Returns a dictionary with 'wikipedia' and 'wikidata' keys.
     """
-    ua = UserAgent()
-    headers = {'User-Agent': ua.random}
+    headers = {'User-Agent': _user_agent().random}
 
     # Search for Wikipedia link
     try:
@@ -145,7 +179,7 @@ def get_wikipedia_and_wikidata_links(topic):
             "https://en.wikipedia.org/w/api.php"
             "?action=opensearch&search={}&limit=1&namespace=0&format=json"
         ).format(topic)
-        response = requests.get(wikipedia_url, headers=headers)
+        response = _WIKI_SESSION.get(wikipedia_url, headers=headers, timeout=_WIKI_TIMEOUT)
         response.raise_for_status()
         wiki_data = response.json()
         wikipedia_link = wiki_data[3][0] if wiki_data[3] else None
@@ -156,12 +190,21 @@ def get_wikipedia_and_wikidata_links(topic):
     wikidata_link = None
     if wikipedia_link:
         try:
-            response = requests.get(wikipedia_link, headers=headers)
+            response = _WIKI_SESSION.get(wikipedia_link, headers=headers, timeout=_WIKI_TIMEOUT)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            wikidata_element = soup.select_one('li#t-wikibase > a')
-            if wikidata_element:
-                wikidata_link = wikidata_element['href']
+            match = _WIKIBASE_LINK_RE.search(response.content)
+            if match:
+                wikidata_link = unescape(match.group(1).decode('utf-8', 'replace'))
+            else:
+                soup = BeautifulSoup(
+                    response.content, 'lxml', parse_only=_WIKIBASE_STRAINER
+                )
+                wikibase_item = soup.find('li', id='t-wikibase')
+                wikidata_element = (
+                    wikibase_item.find('a', recursive=False) if wikibase_item else None
+                )
+                if wikidata_element:
+                    wikidata_link = wikidata_element['href']
         except requests.exceptions.RequestException:
             pass
 
@@ -169,3 +212,12 @@ def get_wikipedia_and_wikidata_links(topic):
         'wikipedia': wikipedia_link,
         'wikidata': wikidata_link
     }
+
+
+def get_links_batch(topics, max_workers=8):
+    """
+    Looks up Wikipedia and Wikidata links for several topics concurrently.
+    Returns one get_wikipedia_and_wikidata_links result per topic, in order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(get_wikipedia_and_wikidata_links, topics))
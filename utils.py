@@ -4,28 +4,99 @@ Common utilities and helper functions for the BlogPosting Schema Generator.
 """
 
 import re
+import copy
+import functools
 import json
 import logging
 import hashlib
 import validators
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Union
+from typing import Dict, List, Any, Optional, Union
 from urllib.parse import urlparse
 import streamlit as st
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns and tables for TextProcessor.clean_text
+_ELLIPSIS_RE = re.compile(r'[.]{3,}')
+_EXCLAMATIONS_RE = re.compile(r'[!]{2,}')
+_QUESTIONS_RE = re.compile(r'[?]{2,}')
+_CONTROL_CHARS = dict.fromkeys([*range(0x00, 0x20), *range(0x7f, 0xa0)])
+
+# Fields every extracted content record must carry a value for
+_REQUIRED_CONTENT_FIELDS = ('url', 'title', 'content')
+
+# Bytes of HTML read per page (ample for head metadata and the article),
+# and the chunk size response bodies are streamed in
+MAX_HTML_BYTES = 1024 * 1024
+_READ_CHUNK_BYTES = 64 * 1024
+
+
+def create_session(pool_connections: int, pool_maxsize: int,
+                   headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """
+    Create a pooled keep-alive session that retries failed requests.
+    
+    Args:
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Maximum connections kept open per host
+        headers: Default headers sent with every request
+        
+    Returns:
+        A session with the retrying adapter mounted for http and https
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+# Pooled keep-alive session for fetch_url_content
+_SESSION = create_session(32, 64, headers={
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+
+
+@functools.lru_cache(maxsize=1)
+def _read_secret_sections() -> tuple:
+    """
+    Read the api_keys and app_config sections of the Streamlit secrets once
+    per process. A failed read raises, and lru_cache doesn't cache
+    exceptions, so the next call tries again.
+    
+    Returns:
+        (api_keys, app_config) as dicts, None for a missing section
+    """
+    api_keys = app_config = None
+    if hasattr(st, 'secrets'):
+        if 'api_keys' in st.secrets:
+            api_keys = dict(st.secrets['api_keys'])
+        if 'app_config' in st.secrets:
+            app_config = dict(st.secrets['app_config'])
+    return api_keys, app_config
+
 
 class ConfigManager:
     """Manage application configuration and settings."""
     
     @staticmethod
     def load_config() -> Dict:
-        """Load configuration from Streamlit secrets or environment."""
+        """
+        Load configuration from Streamlit secrets or environment.
+        
+        Every call returns a fresh dict; only the secrets read is cached.
+        """
         config = {
             'app': {
                 'name': 'BlogPosting Schema Generator',
@@ -55,14 +126,14 @@ class ConfigManager:
         
         # Override with Streamlit secrets if available
         try:
-            if hasattr(st, 'secrets'):
-                if 'api_keys' in st.secrets:
-                    config['api_keys'] = dict(st.secrets['api_keys'])
-                    if 'gemini' in config['api_keys']:
-                        config['analysis']['enable_ai_analysis'] = True
-                
-                if 'app_config' in st.secrets:
-                    config.update(dict(st.secrets['app_config']))
+            api_keys, app_config = _read_secret_sections()
+            if api_keys is not None:
+                config['api_keys'] = copy.deepcopy(api_keys)
+                if 'gemini' in config['api_keys']:
+                    config['analysis']['enable_ai_analysis'] = True
+            
+            if app_config is not None:
+                config.update(copy.deepcopy(app_config))
         
         except Exception as e:
             logger.warning(f"Could not load secrets: {str(e)}")
@@ -70,10 +141,28 @@ class ConfigManager:
         return config
 
 
+def _cached_for_strings(func):
+    """
+    Memoize a one-argument URL helper for string input. Anything else
+    (None, or a list or dict from config or JSON) skips the cache and runs
+    the helper directly, so unhashable values reach its own error handling.
+    """
+    cached = functools.lru_cache(maxsize=1024)(func)
+    
+    @functools.wraps(func)
+    def wrapper(url):
+        if isinstance(url, str):
+            return cached(url)
+        return func(url)
+    
+    return wrapper
+
+
 class URLValidator:
     """Validate and normalize URLs."""
     
     @staticmethod
+    @_cached_for_strings
     def is_valid_url(url: str) -> bool:
         """Check if URL is valid."""
         try:
@@ -82,6 +171,7 @@ class URLValidator:
             return False
     
     @staticmethod
+    @_cached_for_strings
     def normalize_url(url: str) -> str:
         """Normalize URL format."""
         if not url:
@@ -96,6 +186,7 @@ class URLValidator:
         return url
     
     @staticmethod
+    @_cached_for_strings
     def extract_domain(url: str) -> str:
         """Extract domain from URL."""
         try:
@@ -114,11 +205,15 @@ class TextProcessor:
         if not text:
             return ""
         
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
-        text = re.sub(r'[.]{3,}', '...', text)
-        text = re.sub(r'[!]{2,}', '!', text)
-        text = re.sub(r'[?]{2,}', '?', text)
+        text = ' '.join(text.split())
+        text = text.translate(_CONTROL_CHARS)
+        # Skip the regex engine when there is nothing to collapse
+        if '...' in text:
+            text = _ELLIPSIS_RE.sub('...', text)
+        if '!!' in text:
+            text = _EXCLAMATIONS_RE.sub('!', text)
+        if '??' in text:
+            text = _QUESTIONS_RE.sub('?', text)
         
         return text.strip()
     
@@ -128,13 +223,14 @@ class TextProcessor:
         if not text or len(text) <= max_length:
             return text
         
-        truncated = text[:max_length - len(suffix)]
-        last_space = truncated.rfind(' ')
+        # Find the break point before slicing, so the text is copied only once
+        end = max_length - len(suffix)
+        last_space = text.rfind(' ', 0, end)
         
         if last_space > max_length * 0.7:
-            truncated = truncated[:last_space]
+            end = last_space
         
-        return truncated + suffix
+        return text[:end] + suffix
     
     @staticmethod
     def count_words(text: str) -> int:
@@ -156,13 +252,13 @@ class DataValidator:
             'warnings': []
         }
         
-        required_fields = ['url', 'title', 'content']
-        for field in required_fields:
-            if not data.get(field):
-                validation_result['errors'].append(f"Missing field: {field}")
-                validation_result['is_valid'] = False
+        missing = [field for field in _REQUIRED_CONTENT_FIELDS if not data.get(field)]
+        if missing:
+            validation_result['errors'].extend(f"Missing field: {field}" for field in missing)
+            validation_result['is_valid'] = False
         
-        if data.get('url') and not URLValidator.is_valid_url(data['url']):
+        url = data.get('url')
+        if url and not URLValidator.is_valid_url(url):
             validation_result['errors'].append("Invalid URL format")
             validation_result['is_valid'] = False
         
@@ -200,13 +296,35 @@ class ErrorHandler:
 
 
 # Content extraction functions
-def fetch_url_content(url: str, timeout: int = 30) -> BeautifulSoup:
+def read_capped(response: requests.Response, limit: int) -> bytes:
+    """
+    Read a streamed response body, stopping once limit bytes have arrived.
+    
+    Args:
+        response: Response opened with stream=True
+        limit: Maximum number of bytes to read
+        
+    Returns:
+        The body, truncated to limit bytes
+    """
+    buffer = bytearray()
+    for chunk in response.iter_content(_READ_CHUNK_BYTES):
+        buffer.extend(chunk)
+        if len(buffer) >= limit:
+            logger.info(f"Stopped reading {response.url} at {limit} bytes")
+            break
+    return bytes(buffer[:limit])
+
+
+def fetch_url_content(url: str, timeout: int = 30,
+                      max_bytes: int = MAX_HTML_BYTES) -> BeautifulSoup:
     """
     Fetch and parse content from a URL.
     
     Args:
         url: The URL to fetch content from
         timeout: Request timeout in seconds
+        max_bytes: Maximum number of body bytes to read and parse
         
     Returns:
         BeautifulSoup object with parsed HTML content
@@ -217,15 +335,15 @@ def fetch_url_content(url: str, timeout: int = 30) -> BeautifulSoup:
     if not url:
         raise ValueError("URL cannot be empty")
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
     try:
-        response = requests.get(url, headers=headers, timeout=timeout)
-        response.raise_for_status()
+        response = _SESSION.get(url, timeout=timeout, stream=True)
+        try:
+            response.raise_for_status()
+            content = read_capped(response, max_bytes)
+        finally:
+            response.close()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(content, 'lxml')
         return soup
         
     except requests.exceptions.RequestException as e:
@@ -233,22 +351,40 @@ def fetch_url_content(url: str, timeout: int = 30) -> BeautifulSoup:
         raise
 
 
+def fetch_many(urls: List[str], max_workers: int = 16,
+               timeout: int = 30) -> List[Union[BeautifulSoup, Exception]]:
+    """
+    Fetch and parse several URLs concurrently on a thread pool.
+    
+    Args:
+        urls: The URLs to fetch content from
+        max_workers: Number of worker threads
+        timeout: Request timeout in seconds for each URL
+        
+    Returns:
+        Parsed content for each URL, in input order, or the exception
+        raised for a URL that failed
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(fetch_url_content, url, timeout) for url in urls]
+    return [future.exception() or future.result() for future in futures]
+
 def extract_text_from_soup(soup: BeautifulSoup) -> str:
     """Extract clean text content from BeautifulSoup object."""
     if not soup:
         return ""
     
-    # Remove script and style elements
-    for script in soup(["script", "style"]):
-        script.decompose()
-    
-    # Get text content
+    # Get text content; HTML builders store script and style contents as
+    # Script/Stylesheet strings, which get_text() already leaves out, so
+    # the tree does not need to be searched and pruned first
     text = soup.get_text()
     
-    # Clean up the text
-    lines = (line.strip() for line in text.splitlines())
-    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-    text = ' '.join(chunk for chunk in chunks if chunk)
+    # Clean up the text: one comprehension splits lines and double-spaced
+    # phrases, strips them and drops the empty ones
+    text = ' '.join([
+        chunk for line in text.splitlines() for phrase in line.split('  ')
+        if (chunk := phrase.strip())
+    ])
     
     return text
 